@@ -5,25 +5,155 @@ Automatically creates icon PNG and updates manifest/menu files
 """
 
 import argparse
+import functools
+import io
 import json
 import math
 import os
 import re
-import shutil
+import stat
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 try:
+    import PIL
     from PIL import Image, ImageDraw
 except ImportError:
     print("Error: PIL/Pillow not installed. Run: pip install Pillow")
     sys.exit(1)
 
+try:
+    import orjson  # Optional: faster JSON output
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick  # Optional: pyahocorasick, C-level multi-keyword matching
+except ImportError:
+    ahocorasick = None
+
 # Import configuration
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import ADDON_DIRECTORIES, ICON_SIZE
 
+# Keywords (matched as substrings of the lowercased description) -> primitive
+_GEAR_KWS = frozenset({'workcenter', 'manufacturing', 'machine', 'production', 'gear'})
+_CALENDAR_KWS = frozenset({'calendar', 'schedule', 'planning', 'event', 'date'})
+_CHECKBOX_KWS = frozenset({'task', 'checklist', 'todo', 'check'})
+_DOCUMENT_KWS = frozenset({'document', 'file', 'paper', 'form'})
+_FOLDER_KWS = frozenset({'folder', 'directory'})
+_USER_KWS = frozenset({'user', 'people', 'person', 'team', 'employee'})
+_CHART_KWS = frozenset({'chart', 'analytics', 'graph', 'report', 'statistics'})
+_BOX_KWS = frozenset({'warehouse', 'inventory', 'stock', 'box', 'package'})
+_MESSAGE_KWS = frozenset({'message', 'chat', 'telegram', 'communication', 'notification'})
+_SETTINGS_KWS = frozenset({'settings', 'config', 'setup', 'preferences'})
+_ARROW_KWS = frozenset({'arrow', 'flow', 'process', 'workflow'})
+_LOCK_KWS = frozenset({'lock', 'security', 'secure', 'protection'})
+
+# Detection order is drawing order: first primitive is the main one
+_PRIMITIVE_RULES = [
+    ('gear', _GEAR_KWS),
+    ('calendar', _CALENDAR_KWS),
+    ('checkbox', _CHECKBOX_KWS),
+    ('document', _DOCUMENT_KWS),
+    ('folder', _FOLDER_KWS),
+    ('user', _USER_KWS),
+    ('chart', _CHART_KWS),
+    ('box', _BOX_KWS),
+    ('message', _MESSAGE_KWS),
+    ('settings', _SETTINGS_KWS),
+    ('arrow', _ARROW_KWS),
+    ('lock', _LOCK_KWS),
+]
+
+# Circle colors by module category, first match wins
+_COLOR_RULES = [
+    # Manufacturing/Production - industrial blue
+    (frozenset({'manufacturing', 'production', 'workcenter'}), ((52, 73, 94), (41, 128, 185))),
+    # Calendar/Planning - red/orange
+    (frozenset({'calendar', 'schedule', 'planning'}), ((231, 76, 60), (192, 57, 43))),
+    # Tasks - green
+    (frozenset({'task', 'checklist', 'todo'}), ((46, 204, 113), (39, 174, 96))),
+    # Messages - blue (Telegram)
+    (frozenset({'message', 'chat', 'telegram'}), ((0, 136, 204), (0, 108, 163))),
+    # Documents - purple
+    (frozenset({'document', 'file', 'folder'}), ((155, 89, 182), (142, 68, 173))),
+    # Warehouse - orange
+    (frozenset({'warehouse', 'inventory', 'stock'}), ((243, 156, 18), (230, 126, 34))),
+    # Analytics - teal
+    (frozenset({'analytics', 'chart', 'report'}), ((26, 188, 156), (22, 160, 133))),
+]
+
+_ALL_KEYWORDS = frozenset().union(*(kws for _, kws in _PRIMITIVE_RULES),
+                                  *(kws for kws, _ in _COLOR_RULES))
+
+# Manifest / menu XML rewriting patterns
+_ICON_RE = re.compile(r"['\"]icon['\"]:\s*['\"][^'\"]*['\"]")
+_NAME_RE = re.compile(r"(['\"]name['\"]:\s*['\"][^'\"]*['\"],?)")
+_MENUITEM_RE = re.compile(r'(<menuitem\s+[^>]*?)(/?>)')
+_WEB_ICON_RE = re.compile(r'web_icon="[^"]*"')
+
+# Unit vectors for the gear teeth (8 teeth, 45 degrees apart)
+_GEAR_UNIT = [(math.cos(math.radians(a)), math.sin(math.radians(a))) for a in range(0, 360, 45)]
+
+
+def _build_keyword_matcher():
+    """Build a function returning all keywords contained in a text with one C-level scan"""
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for kw in _ALL_KEYWORDS:
+            automaton.add_word(kw, kw)
+        automaton.make_automaton()
+
+        def match(text: str) -> FrozenSet[str]:
+            return frozenset(kw for _, kw in automaton.iter(text))
+        return match
+
+    # Fallback: regex alternation inside a lookahead finds the longest keyword
+    # starting at every position; keywords contained in it are added from a table
+    alternation = '|'.join(map(re.escape, sorted(_ALL_KEYWORDS, key=len, reverse=True)))
+    pattern = re.compile(f'(?=({alternation}))')
+    contained = {kw: frozenset(k for k in _ALL_KEYWORDS if k in kw) for kw in _ALL_KEYWORDS}
+
+    def match(text: str) -> FrozenSet[str]:
+        return frozenset().union(*(contained[kw] for kw in set(pattern.findall(text))))
+    return match
+
+
+_match_keywords = _build_keyword_matcher()
+
+
+@functools.lru_cache(maxsize=16)
+def _decode_text(raw: bytes) -> str:
+    """Decode UTF-8 file content with universal newlines (as text-mode open does)"""
+    return raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _rounded_mask(size: int, margin: int, radius: int) -> Image.Image:
+    """Rounded-rectangle alpha mask, shared between calls (putalpha copies it)"""
+    mask = Image.new('L', (size, size), 0)
+    ImageDraw.Draw(mask).rounded_rectangle([margin, margin, size - margin, size - margin],
+                                           radius=radius, fill=255)
+    return mask
+
+
+@functools.lru_cache(maxsize=32)
+def _base_canvas(size: int, circle_rgb: Tuple[int, int, int]) -> Image.Image:
+    """White rounded background with colored circle; callers draw on a .copy()"""
+    img = Image.new('RGBA', (size, size), (255, 255, 255, 255))
+
+    # Apply rounded corners to white background
+    img.putalpha(_rounded_mask(size, 4, size // 8))
+
+    # Draw colored circle in center
+    circle_radius = size * 0.42
+    circle_center = size / 2
+    ImageDraw.Draw(img).ellipse([circle_center - circle_radius, circle_center - circle_radius,
+                                 circle_center + circle_radius, circle_center + circle_radius],
+                                fill=circle_rgb)
+    return img
+
 
 class OdooIconMaker:
     """Generate icons for Odoo modules"""
@@ -33,11 +163,16 @@ class OdooIconMaker:
     ADDON_DIRS = ADDON_DIRECTORIES
 
     def __init__(self, module_name: str, description: str,
-                 colors: Optional[List[str]] = None, dry_run: bool = False):
+                 colors: Optional[List[str]] = None, dry_run: bool = False,
+                 png_compress_level: int = 1):
         self.module_name = module_name
         self.description = description
         self.colors = colors or []
         self.dry_run = dry_run
+        # zlib level for the PNG encoder: PNG is lossless at every level,
+        # higher levels only trade encode time for a smaller file
+        self.png_compress_level = png_compress_level
+        self._cwd: Optional[Path] = None  # set by run()
         self.result = {
             'status': 'pending',
             'icon_created': False,
@@ -51,8 +186,11 @@ class OdooIconMaker:
     def run(self) -> Dict:
         """Main execution flow"""
         try:
+            # Working directory is resolved once per run
+            self._cwd = Path.cwd()
+
             # Find module directory
-            module_path = self._find_module()
+            module_path = self._find_module(self._cwd)
             if not module_path:
                 self.result['status'] = 'error'
                 self.result['error'] = f"Module directory not found: {self.module_name}"
@@ -62,7 +200,7 @@ class OdooIconMaker:
             icon_path = self._create_icon(module_path)
             if icon_path:
                 self.result['icon_created'] = True
-                self.result['icon_path'] = str(icon_path.relative_to(Path.cwd()))
+                self.result['icon_path'] = str(icon_path.relative_to(self._cwd))
 
             # Update manifest
             if self._update_manifest(module_path):
@@ -80,20 +218,19 @@ class OdooIconMaker:
             self.result['error'] = str(e)
             return self.result
 
-    def _find_module(self) -> Optional[Path]:
-        """Find module directory in addon paths"""
-        cwd = Path.cwd()
-
-        # Check each addon directory
-        for addon_dir in self.ADDON_DIRS:
-            module_path = cwd / addon_dir / self.module_name
-            if module_path.exists() and module_path.is_dir():
-                return module_path
+    def _find_module(self, cwd: Path) -> Optional[Path]:
+        """Find module directory in addon paths relative to cwd"""
+        # Check each addon directory, then root directory
+        candidates = [cwd / addon_dir / self.module_name for addon_dir in self.ADDON_DIRS]
+        candidates.append(cwd / self.module_name)
 
-        # Check root directory
-        root_module = cwd / self.module_name
-        if root_module.exists() and root_module.is_dir():
-            return root_module
+        for module_path in candidates:
+            # One stat() per candidate; missing paths raise instead of a second probe
+            try:
+                if stat.S_ISDIR(os.stat(module_path).st_mode):
+                    return module_path
+            except OSError:
+                continue
 
         return None
 
@@ -111,7 +248,10 @@ class OdooIconMaker:
 
         # Save icon
         if not self.dry_run:
-            img.save(icon_path, 'PNG', optimize=True)
+            # Encode in memory and write the file in one call
+            buf = io.BytesIO()
+            img.save(buf, 'PNG', compress_level=self.png_compress_level)
+            icon_path.write_bytes(buf.getbuffer())
 
             # Verify file
             if not icon_path.exists():
@@ -124,125 +264,40 @@ class OdooIconMaker:
         size = self.ICON_SIZE
         desc_lower = self.description.lower()
 
-        # Detect primitives to draw based on keywords
-        primitives = []
-
-        # Manufacturing/Production
-        if any(kw in desc_lower for kw in ['workcenter', 'manufacturing', 'machine', 'production', 'gear']):
-            primitives.append('gear')
-
-        # Calendar/Planning
-        if any(kw in desc_lower for kw in ['calendar', 'schedule', 'planning', 'event', 'date']):
-            primitives.append('calendar')
-
-        # Tasks/Checklist
-        if any(kw in desc_lower for kw in ['task', 'checklist', 'todo', 'check']):
-            primitives.append('checkbox')
-
-        # Documents/Files
-        if any(kw in desc_lower for kw in ['document', 'file', 'paper', 'form']):
-            primitives.append('document')
-
-        # Folder/Directory
-        if any(kw in desc_lower for kw in ['folder', 'directory']):
-            primitives.append('folder')
-
-        # Users/People
-        if any(kw in desc_lower for kw in ['user', 'people', 'person', 'team', 'employee']):
-            primitives.append('user')
-
-        # Charts/Analytics
-        if any(kw in desc_lower for kw in ['chart', 'analytics', 'graph', 'report', 'statistics']):
-            primitives.append('chart')
-
-        # Warehouse/Boxes
-        if any(kw in desc_lower for kw in ['warehouse', 'inventory', 'stock', 'box', 'package']):
-            primitives.append('box')
-
-        # Messages/Communication
-        if any(kw in desc_lower for kw in ['message', 'chat', 'telegram', 'communication', 'notification']):
-            primitives.append('message')
-
-        # Settings/Configuration
-        if any(kw in desc_lower for kw in ['settings', 'config', 'setup', 'preferences']):
-            primitives.append('settings')
-
-        # Arrow/Flow
-        if any(kw in desc_lower for kw in ['arrow', 'flow', 'process', 'workflow']):
-            primitives.append('arrow')
-
-        # Lock/Security
-        if any(kw in desc_lower for kw in ['lock', 'security', 'secure', 'protection']):
-            primitives.append('lock')
+        # Detect primitives to draw based on keywords (single scan shared with color selection)
+        found = self._find_keywords(desc_lower)
+        primitives = [name for name, kws in _PRIMITIVE_RULES if found & kws]
 
         # Choose background color based on module type
-        bg_colors = self._get_background_colors(desc_lower)
+        bg_colors = self._get_background_colors(found)
 
         # Create composed icon
         return self._compose_icon(size, primitives, bg_colors)
 
-    def _get_background_colors(self, desc_lower: str) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
+    def _find_keywords(self, desc_lower: str) -> FrozenSet[str]:
+        """Return all known keywords contained in the description"""
+        return _match_keywords(desc_lower)
+
+    def _get_background_colors(self, found: FrozenSet[str]) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
         """Choose background colors based on module category"""
         if self.colors and len(self.colors) >= 2:
             return (self._hex_to_rgb(self.colors[0]), self._hex_to_rgb(self.colors[1]))
 
-        # Manufacturing/Production - industrial blue
-        if any(kw in desc_lower for kw in ['manufacturing', 'production', 'workcenter']):
-            return ((52, 73, 94), (41, 128, 185))
-
-        # Calendar/Planning - red/orange
-        if any(kw in desc_lower for kw in ['calendar', 'schedule', 'planning']):
-            return ((231, 76, 60), (192, 57, 43))
-
-        # Tasks - green
-        if any(kw in desc_lower for kw in ['task', 'checklist', 'todo']):
-            return ((46, 204, 113), (39, 174, 96))
-
-        # Messages - blue (Telegram)
-        if any(kw in desc_lower for kw in ['message', 'chat', 'telegram']):
-            return ((0, 136, 204), (0, 108, 163))
-
-        # Documents - purple
-        if any(kw in desc_lower for kw in ['document', 'file', 'folder']):
-            return ((155, 89, 182), (142, 68, 173))
-
-        # Warehouse - orange
-        if any(kw in desc_lower for kw in ['warehouse', 'inventory', 'stock']):
-            return ((243, 156, 18), (230, 126, 34))
-
-        # Analytics - teal
-        if any(kw in desc_lower for kw in ['analytics', 'chart', 'report']):
-            return ((26, 188, 156), (22, 160, 133))
+        for kws, colors in _COLOR_RULES:
+            if found & kws:
+                return colors
 
         # Default - blue
         return ((52, 152, 219), (41, 128, 185))
 
     def _compose_icon(self, size: int, primitives: list, bg_colors: Tuple[Tuple[int, int, int], Tuple[int, int, int]]) -> Image.Image:
         """Compose icon from primitives on white background with colored circle"""
-        # Create white background with rounded corners
-        img = Image.new('RGBA', (size, size), (255, 255, 255, 255))
-
-        # Apply rounded corners to white background
-        margin = 4
-        radius = size // 8
-        mask = Image.new('L', (size, size), 0)
-        mask_draw = ImageDraw.Draw(mask)
-        mask_draw.rounded_rectangle([margin, margin, size - margin, size - margin],
-                                   radius=radius, fill=255)
-        img.putalpha(mask)
-
-        draw = ImageDraw.Draw(img)
-
-        # Draw colored circle in center
-        circle_radius = size * 0.42
-        circle_center = size / 2
-        circle_color = bg_colors[0]  # Use first color for circle
-        draw.ellipse([circle_center - circle_radius, circle_center - circle_radius,
-                     circle_center + circle_radius, circle_center + circle_radius],
-                    fill=circle_color)
+        # White background with rounded corners and colored circle (first color)
+        img = _base_canvas(size, tuple(bg_colors[0])).copy()
 
         if not primitives:
             # No primitives detected - use module initials
+            draw = ImageDraw.Draw(img)
             initials = self._get_initials(self.module_name)
             text_bbox = draw.textbbox((0, 0), initials)
             text_width = text_bbox[2] - text_bbox[0]
@@ -272,39 +327,35 @@ class OdooIconMaker:
 
     def _draw_primitive(self, img: Image.Image, primitive: str, x: float, y: float, prim_size: float):
         """Draw a single primitive at specified position"""
-        draw = ImageDraw.Draw(img)
-
-        if primitive == 'gear':
-            self._primitive_gear(draw, x, y, prim_size)
-        elif primitive == 'calendar':
-            self._primitive_calendar(draw, x, y, prim_size)
-        elif primitive == 'checkbox':
-            self._primitive_checkbox(draw, x, y, prim_size)
-        elif primitive == 'document':
-            self._primitive_document(draw, x, y, prim_size)
-        elif primitive == 'folder':
-            self._primitive_folder(draw, x, y, prim_size)
-        elif primitive == 'user':
-            self._primitive_user(draw, x, y, prim_size)
-        elif primitive == 'chart':
-            self._primitive_chart(draw, x, y, prim_size)
-        elif primitive == 'box':
-            self._primitive_box(draw, x, y, prim_size)
-        elif primitive == 'message':
-            self._primitive_message(draw, x, y, prim_size)
-        elif primitive == 'settings':
-            self._primitive_settings(draw, x, y, prim_size)
-        elif primitive == 'arrow':
-            self._primitive_arrow(draw, x, y, prim_size)
-        elif primitive == 'lock':
-            self._primitive_lock(draw, x, y, prim_size)
+        if primitive not in self._PRIM_DISPATCH:
+            return
+
+        sprite, offset = self._render_sprite(primitive, img.size, x, y, prim_size)
+        if sprite is not None:
+            img.alpha_composite(sprite, offset)
+
+    def _render_sprite(self, primitive: str, canvas_size: Tuple[int, int], x: float, y: float,
+                       prim_size: float) -> Tuple[Optional[Image.Image], Tuple[int, int]]:
+        """Rasterize a primitive once per layout slot into a cropped transparent sprite"""
+        key = (primitive, canvas_size, x, y, prim_size)
+        cached = self._SPRITE_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        # Draw at the real coordinates so pasting gives exactly the same pixels
+        layer = Image.new('RGBA', canvas_size, (0, 0, 0, 0))
+        self._PRIM_DISPATCH[primitive](self, ImageDraw.Draw(layer), x, y, prim_size)
+        bbox = layer.getbbox()
+        cached = (layer.crop(bbox), bbox[:2]) if bbox else (None, (0, 0))
+
+        self._SPRITE_CACHE[key] = cached
+        return cached
 
     # ========== PRIMITIVES ==========
 
     def _primitive_gear(self, draw: ImageDraw.Draw, cx: float, cy: float, size: float):
         """Draw gear primitive - gray metallic"""
         radius = size * 0.35
-        teeth_count = 8
         teeth_size = size * 0.08
 
         # Colors
@@ -313,12 +364,10 @@ class OdooIconMaker:
         center_hole = (52, 73, 94)  # Dark blue-gray
 
         # Draw gear teeth
-        for i in range(teeth_count):
-            angle = (360 / teeth_count) * i
-            rad = math.radians(angle)
-            x1 = cx + (radius + teeth_size) * math.cos(rad)
-            y1 = cy + (radius + teeth_size) * math.sin(rad)
-            draw.line([(cx, cy), (x1, y1)], fill=gear_outline, width=2)
+        teeth_radius = radius + teeth_size
+        for cos_a, sin_a in _GEAR_UNIT:
+            draw.line([(cx, cy), (cx + teeth_radius * cos_a, cy + teeth_radius * sin_a)],
+                      fill=gear_outline, width=2)
 
         # Gear body
         draw.ellipse([cx - radius, cy - radius, cx + radius, cy + radius],
@@ -612,33 +661,24 @@ class OdooIconMaker:
         draw.rectangle([cx - kh_r * 0.4, kh_y, cx + kh_r * 0.4, y + lock_h * 0.75],
                       fill=keyhole_color)
 
-    def _create_gradient_background(self, size: int, color1: Tuple[int, int, int],
-                                   color2: Tuple[int, int, int]) -> Image.Image:
-        """Create base image with gradient background and rounded corners"""
-        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-
-        # Create vertical gradient
-        margin = 4
-        for i in range(size - margin * 2):
-            ratio = i / (size - margin * 2)
-            r = int(color1[0] + (color2[0] - color1[0]) * ratio)
-            g = int(color1[1] + (color2[1] - color1[1]) * ratio)
-            b = int(color1[2] + (color2[2] - color1[2]) * ratio)
-            color = (r, g, b, 255)
-            y = margin + i
-            draw.line([(margin, y), (size - margin, y)], fill=color, width=1)
-
-        # Apply rounded corners
-        radius = size // 8
-        mask = Image.new('L', (size, size), 0)
-        mask_draw = ImageDraw.Draw(mask)
-        mask_draw.rounded_rectangle([margin, margin, size - margin, size - margin],
-                                   radius=radius, fill=255)
-        img.putalpha(mask)
-
-        return img
-
+    # (primitive, canvas size, x, y, prim_size) -> (cropped RGBA sprite, paste offset)
+    _SPRITE_CACHE: Dict[tuple, Tuple[Optional[Image.Image], Tuple[int, int]]] = {}
+
+    # Primitive name -> drawing method
+    _PRIM_DISPATCH = {
+        'gear': _primitive_gear,
+        'calendar': _primitive_calendar,
+        'checkbox': _primitive_checkbox,
+        'document': _primitive_document,
+        'folder': _primitive_folder,
+        'user': _primitive_user,
+        'chart': _primitive_chart,
+        'box': _primitive_box,
+        'message': _primitive_message,
+        'settings': _primitive_settings,
+        'arrow': _primitive_arrow,
+        'lock': _primitive_lock,
+    }
 
     def _get_initials(self, module_name: str) -> str:
         """Extract initials from module name"""
@@ -656,27 +696,25 @@ class OdooIconMaker:
         """Update __manifest__.py with icon path"""
         manifest_path = module_path / '__manifest__.py'
 
-        if not manifest_path.exists():
+        # Read manifest (raw bytes are kept for the backup)
+        try:
+            raw = manifest_path.read_bytes()
+        except FileNotFoundError:
             self.result['warnings'].append(f"__manifest__.py not found in {module_path}")
             return False
-
-        # Read manifest
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = _decode_text(raw)
 
         # Check if icon already exists
-        icon_pattern = r"['\"]icon['\"]:\s*['\"][^'\"]*['\"]"
         icon_value = f"'icon': '/{self.module_name}/static/description/icon.png'"
 
-        if re.search(icon_pattern, content):
+        if _ICON_RE.search(content):
             # Update existing icon entry
-            new_content = re.sub(icon_pattern, icon_value, content)
+            new_content = _ICON_RE.sub(icon_value, content)
         else:
             # Add icon entry after 'name'
             # Find the closing of 'name' entry and add icon after it
-            name_pattern = r"(['\"]name['\"]:\s*['\"][^'\"]*['\"],?)"
-            if re.search(name_pattern, content):
-                new_content = re.sub(name_pattern, r"\1\n    " + icon_value + ",", content)
+            if _NAME_RE.search(content):
+                new_content = _NAME_RE.sub(r"\1\n    " + icon_value + ",", content)
             else:
                 # Add at the beginning of dict
                 dict_start = content.find('{')
@@ -689,11 +727,10 @@ class OdooIconMaker:
         # Save backup and write new content
         if not self.dry_run:
             backup_path = manifest_path.with_suffix('.py.backup')
-            shutil.copy2(manifest_path, backup_path)
-            self.result['backups_created'].append(str(backup_path.relative_to(Path.cwd())))
+            self._write_backup(manifest_path, backup_path, raw)
+            self.result['backups_created'].append(str(backup_path.relative_to(self._cwd)))
 
-            with open(manifest_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            manifest_path.write_text(new_content, encoding='utf-8')
 
         return True
 
@@ -703,13 +740,21 @@ class OdooIconMaker:
 
         # Search for menu files in views directory
         views_dir = module_path / 'views'
-        if not views_dir.exists():
-            return updated_files
 
-        # Find XML files that might contain menus
-        xml_files = list(views_dir.glob('*menu*.xml')) + list(views_dir.glob('*views.xml'))
+        # Find XML files that might contain menus (*menu*.xml or *views.xml),
+        # one directory scan, each file once
+        xml_files = set()
+        try:
+            with os.scandir(views_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith('.xml') and ('menu' in name or name.endswith('views.xml')) \
+                            and entry.is_file():
+                        xml_files.add(Path(entry.path))
+        except FileNotFoundError:
+            return updated_files
 
-        for xml_file in xml_files:
+        for xml_file in sorted(xml_files):
             if self._update_menu_file(xml_file):
                 updated_files.append(str(xml_file.relative_to(module_path)))
 
@@ -717,8 +762,8 @@ class OdooIconMaker:
 
     def _update_menu_file(self, xml_path: Path) -> bool:
         """Update web_icon in a single menu XML file"""
-        with open(xml_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        raw = xml_path.read_bytes()
+        content = _decode_text(raw)
 
         # Check if file contains menuitem
         if '<menuitem' not in content:
@@ -727,42 +772,56 @@ class OdooIconMaker:
         # Find root menuitem entries (without parent attribute)
         # Pattern: <menuitem ... /> or <menuitem ...>...</menuitem>
         # without parent="" attribute
-        menuitem_pattern = r'(<menuitem\s+[^>]*?)(/?>)'
         web_icon_value = f'web_icon="{self.module_name},static/description/icon.png"'
 
         modified = False
-        new_content = content
 
-        # Process each menuitem
-        for match in re.finditer(menuitem_pattern, content):
+        def update_menuitem(match):
+            nonlocal modified
             menuitem_tag = match.group(1)
             closing = match.group(2)
 
-            # Check if this is a root menuitem (no parent attribute)
-            if 'parent=' not in menuitem_tag:
-                # Check if web_icon already exists
-                if 'web_icon=' in menuitem_tag:
-                    # Update existing web_icon
-                    updated_tag = re.sub(r'web_icon="[^"]*"', web_icon_value, menuitem_tag)
-                else:
-                    # Add web_icon before closing
-                    updated_tag = menuitem_tag + f'\n          {web_icon_value}'
+            # Only root menuitems (no parent attribute) get an icon
+            if 'parent=' in menuitem_tag:
+                return match.group(0)
+
+            modified = True
+            # Check if web_icon already exists
+            if 'web_icon=' in menuitem_tag:
+                # Update existing web_icon
+                return _WEB_ICON_RE.sub(web_icon_value, menuitem_tag) + closing
+            # Add web_icon before closing
+            return menuitem_tag + f'\n          {web_icon_value}' + closing
 
-                new_content = new_content.replace(menuitem_tag + closing, updated_tag + closing)
-                modified = True
+        # Process each menuitem in a single pass
+        new_content = _MENUITEM_RE.sub(update_menuitem, content)
 
         if modified and not self.dry_run:
             # Backup original
             backup_path = xml_path.with_suffix('.xml.backup')
-            shutil.copy2(xml_path, backup_path)
-            self.result['backups_created'].append(str(backup_path.relative_to(Path.cwd())))
+            self._write_backup(xml_path, backup_path, raw)
+            self.result['backups_created'].append(str(backup_path.relative_to(self._cwd)))
 
             # Write updated content
-            with open(xml_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            xml_path.write_text(new_content, encoding='utf-8')
 
         return modified
 
+    def _write_backup(self, source_path: Path, backup_path: Path, raw: bytes):
+        """Write already-read file content as backup, keeping the source timestamps"""
+        st = os.stat(source_path)
+        backup_path.write_bytes(raw)
+        os.utime(backup_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _check_pillow_simd():
+    """Recommend Pillow-SIMD (versions like '9.5.0.post1') for bulk icon generation"""
+    if 'post' in PIL.__version__ or os.environ.get('ALLOW_STOCK_PIL'):
+        return
+    print("Note: stock Pillow detected. For faster bulk icon generation install Pillow-SIMD:\n"
+          "  pip uninstall pillow && CC=\"cc -mavx2\" pip install pillow-simd\n"
+          "Set ALLOW_STOCK_PIL=1 to silence this note.", file=sys.stderr)
+
 
 def main():
     parser = argparse.ArgumentParser(description='Generate icons for Odoo modules')
@@ -771,8 +830,11 @@ def main():
     parser.add_argument('--colors', help='Comma-separated hex colors (e.g., #714B67,#4CAF50)')
     parser.add_argument('--dry-run', action='store_true', help='Preview without writing files')
     parser.add_argument('--force', action='store_true', help='Overwrite without confirmation')
+    parser.add_argument('--png-compress-level', type=int, default=1, choices=range(10), metavar='0-9',
+                        help='PNG zlib compression level (lossless at any level; default: 1, use 9 for smallest file)')
 
     args = parser.parse_args()
+    _check_pillow_simd()
 
     # Parse colors
     colors = []
@@ -784,14 +846,22 @@ def main():
         module_name=args.module,
         description=args.description,
         colors=colors,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        png_compress_level=args.png_compress_level
     )
 
     # Run
     result = maker.run()
 
-    # Output JSON result
-    print(json.dumps(result, indent=2))
+    # Output JSON result as UTF-8 bytes (same text with or without orjson,
+    # independent of the stdout encoding)
+    if orjson is not None:
+        output = orjson.dumps(result, option=orjson.OPT_INDENT_2)
+    else:
+        output = json.dumps(result, indent=2, ensure_ascii=False).encode('utf-8')
+    sys.stdout.flush()
+    sys.stdout.buffer.write(output + b'\n')
+    sys.stdout.flush()
 
     # Exit with appropriate code
     sys.exit(0 if result['status'] == 'success' else 1)
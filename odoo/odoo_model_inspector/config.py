@@ -22,4 +22,8 @@ ADDON_DIRECTORIES = [
 OUTPUT_DIRECTORY = '.odoo_inspect'
 
 # Alternative: use absolute path
-# OUTPUT_DIRECTORY = Path.home() / 'Documents' / 'odoo_analysis'
\ No newline at end of file
+# OUTPUT_DIRECTORY = Path.home() / 'Documents' / 'odoo_analysis'
+
+# Persistent cache of parsed model files (safe to delete at any time)
+# Set to None to disable
+CACHE_DIRECTORY = Path.home() / '.cache' / 'odoo_model_inspector'
@@ -5,79 +5,147 @@ JSON formatter for model inspection results.
 import json
 from typing import Dict, List, Optional, TYPE_CHECKING
 
+try:
+    import orjson  # Optional: faster serialization
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from parsers.dependency_resolver import InheritanceNode
     from parsers.model_parser import ModelInfo
 
 
-class JsonFormatter:
-    """Formats inspection results as JSON."""
-
-    @staticmethod
-    def format_inheritance_chain(
-        model_name: str,
-        chain: List,
-        context_module: Optional[str] = None,
-        base_definition = None,
-        docs_paths: Optional[List[str]] = None
-    ) -> str:
-        """
-        Format inheritance chain as JSON.
-
-        Args:
-            model_name: Name of the model
-            chain: List of InheritanceNode objects
-            context_module: Optional context module name
-            base_definition: Optional base model definition
-            docs_paths: Optional list of documentation paths
-
-        Returns:
-            JSON string
-        """
-        # Calculate totals
-        total_fields = sum(len(node.model_info.fields) for node in chain)
-        modules_involved = len(chain)
-
-        # Build chain data
-        chain_data = []
-        for node in chain:
-            node_dict = node.to_dict()
-            chain_data.append(node_dict)
-
-        # Build base definition data
-        base_def_data = None
-        if base_definition:
-            base_def_data = {
-                'module': base_definition.module,
-                'file': str(base_definition.file_path),
-                'line': base_definition.line
-            }
-
-        # Build result
-        result = {
-            'model': model_name,
-            'context_module': context_module,
-            'base_definition': base_def_data,
-            'inheritance_chain': chain_data,
-            'total_fields': total_fields,
-            'modules_involved': modules_involved,
-            'docs_to_read': docs_paths or []
+def _default(obj):
+    """
+    Serialize chain objects (InheritanceNode, ModelInfo) during encoding.
+
+    Args:
+        obj: Object the encoder cannot handle natively
+
+    Returns:
+        JSON-compatible dict
+    """
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def _dumps(obj) -> bytes:
+    """
+    Serialize to indented UTF-8 JSON, using orjson when available.
+
+    Both backends produce the same text (non-ASCII is not escaped).
+
+    Args:
+        obj: JSON-compatible object; chain nodes are converted via _default
+
+    Returns:
+        JSON encoded as UTF-8
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(obj, indent=2, default=_default, ensure_ascii=False).encode('utf-8')
+
+
+def format_inheritance_chain(
+    model_name: str,
+    chain: List,
+    context_module: Optional[str] = None,
+    base_definition = None,
+    docs_paths: Optional[List[str]] = None
+) -> str:
+    """
+    Format inheritance chain as JSON.
+
+    Args:
+        model_name: Name of the model
+        chain: List of InheritanceNode objects
+        context_module: Optional context module name
+        base_definition: Optional base model definition
+        docs_paths: Optional list of documentation paths
+
+    Returns:
+        JSON string
+    """
+    return format_inheritance_chain_bytes(
+        model_name, chain, context_module, base_definition, docs_paths
+    ).decode('utf-8')
+
+
+def format_inheritance_chain_bytes(
+    model_name: str,
+    chain: List,
+    context_module: Optional[str] = None,
+    base_definition = None,
+    docs_paths: Optional[List[str]] = None
+) -> bytes:
+    """
+    Format inheritance chain as UTF-8 encoded JSON.
+
+    Args:
+        model_name: Name of the model
+        chain: List of InheritanceNode objects
+        context_module: Optional context module name
+        base_definition: Optional base model definition
+        docs_paths: Optional list of documentation paths
+
+    Returns:
+        JSON encoded as UTF-8
+    """
+    # Calculate totals
+    total_fields = sum(len(node.model_info.fields) for node in chain)
+    modules_involved = len(chain)
+
+    # Build base definition data
+    base_def_data = None
+    if base_definition:
+        base_def_data = {
+            'module': base_definition.module,
+            'file': str(base_definition.file_path),
+            'line': base_definition.line
         }
 
-        return json.dumps(result, indent=2)
+    # Build result
+    result = {
+        'model': model_name,
+        'context_module': context_module,
+        'base_definition': base_def_data,
+        'inheritance_chain': chain,  # Nodes serialized by _default
+        'total_fields': total_fields,
+        'modules_involved': modules_involved,
+        'docs_to_read': docs_paths or []
+    }
+
+    return _dumps(result)
+
+
+def format_error(error_message: str) -> str:
+    """
+    Format error as JSON.
+
+    Args:
+        error_message: Error message
+
+    Returns:
+        JSON string
+    """
+    return format_error_bytes(error_message).decode('utf-8')
+
 
-    @staticmethod
-    def format_error(error_message: str) -> str:
-        """
-        Format error as JSON.
+def format_error_bytes(error_message: str) -> bytes:
+    """
+    Format error as UTF-8 encoded JSON.
 
-        Args:
-            error_message: Error message
+    Args:
+        error_message: Error message
 
-        Returns:
-            JSON string
-        """
-        return json.dumps({
-            'error': error_message,
-            'status': 'failed'
-        }, indent=2)
+    Returns:
+        JSON encoded as UTF-8
+    """
+    return _dumps({
+        'error': error_message,
+        'status': 'failed'
+    })
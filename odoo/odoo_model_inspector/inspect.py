@@ -11,10 +11,10 @@ from pathlib import Path
 # Add parsers and formatters to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from parsers.dependency_resolver import DependencyResolver
-from formatters.json_formatter import JsonFormatter
-from formatters.markdown_formatter import MarkdownFormatter
-from config import PROJECT_ROOT, ADDON_DIRECTORIES
+# Parsers and the Markdown formatter are imported lazily in main()
+from formatters.json_formatter import format_error_bytes as json_error
+from formatters.json_formatter import format_inheritance_chain_bytes as json_inheritance_chain
+from config import PROJECT_ROOT, ADDON_DIRECTORIES, OUTPUT_DIRECTORY, CACHE_DIRECTORY
 
 
 def get_addon_paths() -> list:
@@ -33,6 +33,28 @@ def get_addon_paths() -> list:
     return paths
 
 
+def write_stdout(data: bytes):
+    """
+    Write UTF-8 output to stdout as bytes (independent of the stdout encoding).
+
+    Args:
+        data: Encoded output; a newline is appended
+    """
+    sys.stdout.flush()  # keep order with earlier print() output
+    sys.stdout.buffer.write(data + b'\n')
+    sys.stdout.flush()
+
+
+def get_manifest_cache_path() -> Path:
+    """
+    Get path of the persistent manifest cache.
+
+    Returns:
+        Path inside OUTPUT_DIRECTORY (relative to PROJECT_ROOT unless absolute)
+    """
+    return PROJECT_ROOT / OUTPUT_DIRECTORY / '.manifest_cache.json'
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Analyze Odoo model inheritance chain'
@@ -50,6 +72,12 @@ def main():
         '--output-markdown',
         help='Output Markdown file path (optional)'
     )
+    parser.add_argument(
+        '--processes',
+        type=int,
+        default=0,
+        help='Parse model files in N worker processes (default: in-process)'
+    )
 
     args = parser.parse_args()
 
@@ -58,11 +86,17 @@ def main():
         addon_paths = get_addon_paths()
 
         if not addon_paths:
-            print(JsonFormatter.format_error("No addon directories found"))
+            write_stdout(json_error("No addon directories found"))
             sys.exit(1)
 
         # Initialize resolver
-        resolver = DependencyResolver(addon_paths)
+        from parsers.dependency_resolver import DependencyResolver
+        resolver = DependencyResolver(
+            addon_paths,
+            manifest_cache_path=get_manifest_cache_path(),
+            ast_cache_dir=CACHE_DIRECTORY,
+            parse_processes=args.processes
+        )
 
         # Build inheritance chain
         chain = resolver.build_inheritance_chain(
@@ -71,25 +105,28 @@ def main():
         )
 
         if not chain:
-            print(JsonFormatter.format_error(f"Model '{args.model}' not found"))
+            write_stdout(json_error(f"Model '{args.model}' not found"))
             sys.exit(1)
 
-        # Find base definition
-        base_def = resolver.find_base_definition(args.model)
+        # Find base definition (the chain puts it first when it is in scope)
+        base_def = next((node.model_info for node in chain if node.model_info.is_base), None)
+        if base_def is None:
+            base_def = resolver.find_base_definition(args.model)
 
         # Output JSON to stdout
-        json_output = JsonFormatter.format_inheritance_chain(
+        json_output = json_inheritance_chain(
             model_name=args.model,
             chain=chain,
             context_module=args.context_module,
             base_definition=base_def,
             docs_paths=None
         )
-        print(json_output)
+        write_stdout(json_output)
 
         # Optionally output Markdown
         if args.output_markdown:
-            markdown_output = MarkdownFormatter.format_inheritance_chain(
+            from formatters.markdown_formatter import format_inheritance_chain_bytes as md_inheritance_chain_bytes
+            markdown_output = md_inheritance_chain_bytes(
                 model_name=args.model,
                 chain=chain,
                 context_module=args.context_module,
@@ -99,13 +136,13 @@ def main():
 
             output_path = Path(args.output_markdown)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(markdown_output, encoding='utf-8')
+            output_path.write_bytes(markdown_output)
 
             # Print info to stderr so it doesn't mix with JSON
             print(f"Markdown saved to: {output_path}", file=sys.stderr)
 
     except Exception as e:
-        print(JsonFormatter.format_error(str(e)))
+        write_stdout(json_error(str(e)))
         sys.exit(1)
 
 
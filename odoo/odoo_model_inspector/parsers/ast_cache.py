@@ -0,0 +1,184 @@
+"""
+Persistent on-disk cache of parsed model files.
+Stores pickled ModelInfo lists keyed by the SHA-256 of the source, plus a
+stat index (path -> mtime, size, digest) to skip reading unchanged files.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import pickle
+import sys
+import threading
+import weakref
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class PersistentASTCache:
+    """Caches parse results across runs, one pickle file per source digest."""
+
+    def __init__(self, cache_dir: Path, schema_version: int, variant: str = ''):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory holding the cache files (created on first write)
+            schema_version: Parser schema version; bumping it invalidates entries
+            variant: Parser option suffix; entries of different variants
+                are kept apart
+        """
+        self.cache_dir = Path(cache_dir)
+        # Python version is part of the key: AST output and pickles may differ
+        tag = f"v{schema_version}{variant}-py{sys.version_info[0]}.{sys.version_info[1]}"
+        self._key_prefix = f"{tag}\0".encode('ascii')
+        # Stat index maps to digests of this tag only, so it is kept per tag
+        self._index_path = self.cache_dir / f'stat_index-{tag}.json'
+        self._index: Optional[Dict[str, List]] = None  # loaded on first use
+        # Entries recorded by this process, merged into the file on save
+        self._index_updates: Dict[str, List] = {}
+        self._lock = threading.Lock()
+
+    def __del__(self) -> None:
+        # Cache dropped before exit (long-running callers): flush now
+        try:
+            self.save_index()
+        except Exception:
+            pass
+
+    def key(self, source: bytes) -> str:
+        """
+        Compute cache key for source code.
+
+        Args:
+            source: Raw file content
+
+        Returns:
+            Hex digest of (schema version, Python version, source)
+        """
+        return hashlib.sha256(self._key_prefix + source).hexdigest()
+
+    def get(self, key: str) -> Optional[List]:
+        """
+        Load cached parse result.
+
+        Args:
+            key: Cache key from key()
+
+        Returns:
+            List of ModelInfo objects or None on miss
+        """
+        try:
+            with open(self.cache_dir / f"{key}.pkl", 'rb') as f:
+                models = pickle.load(f)
+        except Exception:
+            # Missing, truncated or incompatible entry: treat as a miss
+            return None
+        return models if isinstance(models, list) else None
+
+    def put(self, key: str, models: List) -> None:
+        """
+        Store parse result (atomic replace; errors are ignored).
+
+        Args:
+            key: Cache key from key()
+            models: List of ModelInfo objects
+        """
+        path = self.cache_dir / f"{key}.pkl"
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(models, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError:
+            # Cache is an optimization only
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def lookup_stat(self, path: str, st: os.stat_result) -> Optional[str]:
+        """
+        Find the digest recorded for an unchanged file.
+
+        Args:
+            path: File path
+            st: Current stat result of the file
+
+        Returns:
+            Cache key if mtime and size match the index, else None
+        """
+        entry = self._get_index().get(path)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+        return None
+
+    def record_stat(self, path: str, st: os.stat_result, key: str) -> None:
+        """
+        Remember the digest of a file for its current mtime and size.
+
+        Args:
+            path: File path
+            st: Stat result taken before the file was read
+            key: Cache key of the file content
+        """
+        entry = [st.st_mtime_ns, st.st_size, key]
+        index = self._get_index()
+        if index.get(path) == entry:
+            return
+        with self._lock:
+            index[path] = entry
+            self._index_updates[path] = entry
+
+    def _get_index(self) -> Dict[str, List]:
+        """Load the stat index on first use and register the exit flush."""
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = self._read_index()
+                    _LIVE_CACHES.add(self)
+        return self._index
+
+    def _read_index(self) -> Dict[str, List]:
+        """Read the stat index file (empty if missing or corrupt)."""
+        try:
+            with open(self._index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def save_index(self) -> None:
+        """Write the stat index if it changed (atomic replace; errors are ignored)."""
+        if not self._index_updates:
+            return
+
+        tmp_path = self._index_path.with_name(f"{self._index_path.name}.{os.getpid()}.tmp")
+        with self._lock:
+            # Re-read so entries saved meanwhile by other processes are kept
+            index = self._read_index()
+            index.update(self._index_updates)
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(index, f, separators=(',', ':'))
+                os.replace(tmp_path, self._index_path)
+                self._index_updates.clear()
+            except OSError:
+                pass
+
+
+# Caches with a loaded stat index, flushed by one exit hook. Weak
+# references: registering does not keep caches alive.
+_LIVE_CACHES: 'weakref.WeakSet[PersistentASTCache]' = weakref.WeakSet()
+
+
+def _save_all_indexes() -> None:
+    """Save the stat indexes of all live caches at exit."""
+    for cache in list(_LIVE_CACHES):
+        cache.save_index()
+
+
+atexit.register(_save_all_indexes)
@@ -3,21 +3,30 @@ Dependency resolver for Odoo modules.
 Builds inheritance chain for models.
 """
 
+import heapq
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .manifest_parser import ManifestParser
 from .model_parser import ModelParser, ModelInfo
 
+# Module scans are I/O bound (stat + read), so oversubscribe the CPUs
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 class InheritanceNode:
     """Node in the inheritance chain."""
 
-    def __init__(self, model_info: ModelInfo, order: int):
+    # No per-instance __dict__ (one node per module in the chain)
+    __slots__ = ('model_info', 'order', 'depends_on')
+
+    def __init__(self, model_info: ModelInfo, order: int, depends_on: Optional[List[str]] = None):
         self.model_info = model_info
         self.order = order
-        self.depends_on: List[str] = []
+        self.depends_on: List[str] = depends_on if depends_on is not None else []
 
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
@@ -30,16 +39,33 @@ class InheritanceNode:
 class DependencyResolver:
     """Resolves module and model dependencies."""
 
-    def __init__(self, addon_paths: List[Path]):
+    def __init__(
+        self,
+        addon_paths: List[Path],
+        manifest_cache_path: Optional[Path] = None,
+        ast_cache_dir: Optional[Path] = None,
+        parse_processes: int = 0,
+        model_parser: Optional[ModelParser] = None
+    ):
         """
         Initialize resolver.
 
         Args:
             addon_paths: List of paths to addon directories
+            manifest_cache_path: Optional file for the persistent manifest cache
+            ast_cache_dir: Optional directory for the persistent AST cache
+            parse_processes: Worker processes for parsing model files (0 = in-process)
+            model_parser: Optional parser shared with other resolvers (e.g.
+                get_default_parser()); ast_cache_dir and parse_processes are
+                ignored when given
         """
         self.addon_paths = addon_paths
-        self.manifest_parser = ManifestParser(addon_paths)
-        self.model_parser = ModelParser()
+        self.manifest_parser = ManifestParser(addon_paths, cache_path=manifest_cache_path)
+        if model_parser is None:
+            model_parser = ModelParser(cache_dir=ast_cache_dir, processes=parse_processes)
+        self.model_parser = model_parser
+        self._all_modules_cache: Dict[Tuple[Path, ...], Tuple[str, ...]] = {}
+        self._base_definitions: Dict[str, Optional[ModelInfo]] = {}
 
     def build_inheritance_chain(self, model_name: str, context_module: Optional[str] = None) -> List[InheritanceNode]:
         """
@@ -65,6 +91,10 @@ class DependencyResolver:
                 base_module = module_name
                 break
 
+        # A full scan sees every module, so its base is the global base definition
+        if base_module and not context_module:
+            self._base_definitions.setdefault(model_name, modules_with_model[base_module])
+
         # Step 3: Build dependency graph
         dependency_graph = self._build_dependency_graph(modules_with_model)
 
@@ -88,12 +118,9 @@ class DependencyResolver:
         chain = []
         for order, module_name in enumerate(sorted_modules, start=1):
             model_info = modules_with_model[module_name]
-            node = InheritanceNode(model_info, order)
-
-            # Add dependencies from manifest
+            # Add dependencies from manifest, filtered to deps in our chain
             deps = self.manifest_parser.get_dependencies(module_name)
-            # Filter to only deps that are in our chain
-            node.depends_on = [d for d in deps if d in modules_with_model]
+            node = InheritanceNode(model_info, order, [d for d in deps if d in modules_with_model])
 
             chain.append(node)
 
@@ -121,22 +148,38 @@ class DependencyResolver:
             # Search all available modules
             modules_to_search = self._get_all_modules()
 
-        # Search each module for the model
-        for module_name in modules_to_search:
-            module_path = self.manifest_parser.find_module_path(module_name)
-            if not module_path:
-                continue
+        # Search each module for the model (in parallel, results kept in order)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [executor.submit(self._scan_one, m, model_name) for m in modules_to_search]
 
-            models = self.model_parser.find_models_in_module(module_path, module_name, model_name)
+            for future in futures:
+                module_name, models = future.result()
 
-            # Take the first matching model from this module
-            for model_info in models:
-                if model_info.model_name == model_name:
-                    result[module_name] = model_info
-                    break
+                # Take the first matching model from this module
+                for model_info in models:
+                    if model_info.model_name == model_name:
+                        result[module_name] = model_info
+                        break
 
         return result
 
+    def _scan_one(self, module_name: str, model_name: str) -> Tuple[str, List[ModelInfo]]:
+        """
+        Find models matching a model name in a single module.
+
+        Args:
+            module_name: Name of the module
+            model_name: Name of the model
+
+        Returns:
+            Tuple of (module_name, list of matching ModelInfo objects)
+        """
+        module_path = self.manifest_parser.find_module_path(module_name)
+        if not module_path:
+            return module_name, []
+
+        return module_name, self.model_parser.find_models_in_module(module_path, module_name, model_name)
+
     def _get_all_modules(self) -> List[str]:
         """
         Get list of all available modules.
@@ -144,20 +187,30 @@ class DependencyResolver:
         Returns:
             List of module names
         """
+        cache_key = tuple(self.addon_paths)
+        cached = self._all_modules_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         modules = []
         for addon_path in self.addon_paths:
-            if not addon_path.exists():
+            try:
+                it = os.scandir(addon_path)
+            except OSError:
                 continue
 
-            for item in addon_path.iterdir():
-                if not item.is_dir():
-                    continue
+            with it:
+                for entry in it:
+                    # DirEntry.is_dir() is cached from the directory listing
+                    # (symlinked modules are followed, as before)
+                    if not entry.is_dir():
+                        continue
 
-                # Check if it has __manifest__.py
-                manifest = item / '__manifest__.py'
-                if manifest.exists():
-                    modules.append(item.name)
+                    # Check if it has __manifest__.py
+                    if os.path.exists(os.path.join(entry.path, '__manifest__.py')):
+                        modules.append(entry.name)
 
+        self._all_modules_cache[cache_key] = tuple(modules)
         return modules
 
     def _build_dependency_graph(self, modules_with_model: Dict[str, ModelInfo]) -> Dict[str, List[str]]:
@@ -190,42 +243,61 @@ class DependencyResolver:
         Returns:
             Sorted list of module names
         """
-        # Calculate in-degree for each node
+        # In-degree = number of dependencies inside the graph
         in_degree = {node: 0 for node in graph}
-        for node in graph:
-            for dep in graph[node]:
-                if dep in in_degree:
-                    in_degree[dep] += 1
-
-        # Find nodes with no dependencies (base modules)
-        queue = [node for node, degree in in_degree.items() if degree == 0]
+        # Reverse adjacency: module -> modules that depend on it
+        dependents: Dict[str, List[str]] = {node: [] for node in graph}
+        for node, deps in graph.items():
+            for dep in deps:
+                if dep in dependents:
+                    in_degree[node] += 1
+                    dependents[dep].append(node)
+
+        # Start with nodes that have no dependencies (base modules);
+        # the heap keeps the order deterministic
+        heap = [node for node, degree in in_degree.items() if degree == 0]
+        heapq.heapify(heap)
         result = []
 
-        while queue:
-            # Sort to ensure deterministic order
-            queue.sort()
-            node = queue.pop(0)
+        while heap:
+            node = heapq.heappop(heap)
             result.append(node)
 
             # Reduce in-degree for dependent nodes
-            for other_node in graph:
-                if node in graph[other_node]:
-                    in_degree[other_node] -= 1
-                    if in_degree[other_node] == 0:
-                        queue.append(other_node)
+            for other_node in dependents[node]:
+                in_degree[other_node] -= 1
+                if in_degree[other_node] == 0:
+                    heapq.heappush(heap, other_node)
 
         # Check for circular dependencies
         if len(result) != len(graph):
             # Return what we have, but warn
             print(f"Warning: Circular dependency detected in modules: {set(graph.keys()) - set(result)}", file=sys.stderr)
 
-        # Reverse to get correct order (base first, extensions last)
-        return list(reversed(result))
+        # Base first, extensions last
+        return result
 
     def find_base_definition(self, model_name: str) -> Optional[ModelInfo]:
         """
         Find the base definition of a model (_name = ...).
 
+        Args:
+            model_name: Name of the model
+
+        Returns:
+            ModelInfo of base definition or None
+        """
+        if model_name in self._base_definitions:
+            return self._base_definitions[model_name]
+
+        base_definition = self._scan_base_definition(model_name)
+        self._base_definitions[model_name] = base_definition
+        return base_definition
+
+    def _scan_base_definition(self, model_name: str) -> Optional[ModelInfo]:
+        """
+        Scan all modules for the base definition of a model.
+
         Args:
             model_name: Name of the model
 
@@ -234,15 +306,17 @@ class DependencyResolver:
         """
         all_modules = self._get_all_modules()
 
-        for module_name in all_modules:
-            module_path = self.manifest_parser.find_module_path(module_name)
-            if not module_path:
-                continue
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [executor.submit(self._scan_one, m, model_name) for m in all_modules]
 
-            models = self.model_parser.find_models_in_module(module_path, module_name, model_name)
+            # Check in module order so the first definition wins
+            for i, future in enumerate(futures):
+                _, models = future.result()
 
-            for model_info in models:
-                if model_info.is_base and model_info.model_name == model_name:
-                    return model_info
+                for model_info in models:
+                    if model_info.is_base and model_info.model_name == model_name:
+                        for pending in futures[i + 1:]:
+                            pending.cancel()
+                        return model_info
 
         return None
@@ -4,22 +4,95 @@ Extracts module dependencies and metadata.
 """
 
 import ast
+import atexit
+import json
+import os
+import threading
+import weakref
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 class ManifestParser:
     """Parses __manifest__.py files to extract module metadata."""
 
-    def __init__(self, addon_paths: List[Path]):
+    def __init__(self, addon_paths: List[Path], cache_path: Optional[Path] = None):
         """
         Initialize parser with addon directories.
 
         Args:
             addon_paths: List of paths to addon directories
+            cache_path: Optional JSON file used to persist parsed manifests
+                between runs (disabled when None)
         """
         self.addon_paths = [Path(p) for p in addon_paths]
-        self._cache: Dict[str, Dict] = {}
+        self._cache: Dict[Path, Dict] = {}  # module path -> manifest data
+        self._trans_deps: Dict[str, Tuple[str, ...]] = {}
+        self._module_index: Optional[Dict[str, Path]] = None
+        self._manifests: Dict[str, Dict] = {}
+        self._deps: Dict[str, List[str]] = {}
+        # Guards cache writes (modules are scanned from worker threads)
+        self._lock = threading.Lock()
+        self._index_lock = threading.Lock()
+
+        # Persistent cache: manifest path -> [[st_mtime_ns, st_size], data].
+        # JSON, not pickle: the file lives in the analysed project tree and
+        # must not be able to run code when loaded.
+        self._cache_path = Path(cache_path) if cache_path else None
+        self._disk_cache: Dict[str, List] = {}
+        self._disk_dirty = False
+        if self._cache_path:
+            self._disk_cache = self._load_disk_cache()
+            _LIVE_PARSERS.add(self)
+
+    def __del__(self):
+        # Parser dropped before exit (long-running callers): flush now
+        try:
+            self.save_cache()
+        except Exception:
+            pass
+
+    def _load_disk_cache(self) -> Dict:
+        """
+        Load the persistent manifest cache.
+
+        Returns:
+            Cached entries, or an empty dict if missing or unreadable
+        """
+        try:
+            with open(self._cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {
+            key: entry for key, entry in data.items()
+            if isinstance(entry, list) and len(entry) == 2 and isinstance(entry[1], dict)
+        }
+
+    def save_cache(self):
+        """Write the persistent manifest cache if it changed."""
+        if not self._cache_path or not self._disk_dirty:
+            return
+
+        # Unique temp name: concurrent runs must not write the same file
+        tmp_path = self._cache_path.with_name(
+            f"{self._cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with self._lock:
+            try:
+                self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._disk_cache, f, ensure_ascii=False, separators=(',', ':'))
+                os.replace(tmp_path, self._cache_path)
+                self._disk_dirty = False
+            except OSError:
+                # Cache is an optimization only
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
 
     def find_module_path(self, module_name: str) -> Optional[Path]:
         """
@@ -31,13 +104,42 @@ class ManifestParser:
         Returns:
             Path to module directory or None if not found
         """
-        for addon_path in self.addon_paths:
-            module_path = addon_path / module_name
-            if module_path.exists() and module_path.is_dir():
-                manifest_path = module_path / '__manifest__.py'
-                if manifest_path.exists():
-                    return module_path
-        return None
+        if self._module_index is None:
+            self._build_index()
+        return self._module_index.get(module_name)
+
+    def _build_index(self):
+        """
+        Index module name -> module directory (earlier addon paths win).
+
+        Every indexed manifest is parsed once here so dependency lookups are
+        served from memory afterwards.
+        """
+        with self._index_lock:
+            if self._module_index is not None:
+                return
+
+            index: Dict[str, Path] = {}
+            for addon_path in self.addon_paths:
+                try:
+                    it = os.scandir(addon_path)
+                except OSError:
+                    continue
+
+                with it:
+                    for entry in it:
+                        if entry.name in index or not entry.is_dir():
+                            continue
+                        if os.path.exists(os.path.join(entry.path, '__manifest__.py')):
+                            index[entry.name] = Path(entry.path)
+
+            for module_name, module_path in index.items():
+                manifest = self.parse_manifest(module_path)
+                self._manifests[module_name] = manifest
+                # Filter out None values and ensure strings
+                self._deps[module_name] = [dep for dep in manifest.get('depends') or [] if dep]
+
+            self._module_index = index
 
     def parse_manifest(self, module_path: Path) -> Dict:
         """
@@ -49,39 +151,90 @@ class ManifestParser:
         Returns:
             Dictionary with manifest data
         """
-        manifest_path = module_path / '__manifest__.py'
+        # Check cache (Path keys: no str() or path join on a hit)
+        cached = self._cache.get(module_path)
+        if cached is not None:
+            return cached
 
-        if not manifest_path.exists():
+        manifest_path = module_path / '__manifest__.py'
+        try:
+            st = os.stat(manifest_path)
+        except OSError:
             return {}
 
-        # Check cache
-        cache_key = str(manifest_path)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        # Check persistent cache (unchanged file => same mtime and size)
+        stamp = [st.st_mtime_ns, st.st_size]
+        disk_key = str(manifest_path)
+        cached = self._disk_cache.get(disk_key)
+        if cached is not None and cached[0] == stamp:
+            with self._lock:
+                self._cache[module_path] = cached[1]
+            return cached[1]
 
         try:
             # Read and parse as Python dict
             with open(manifest_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            # Parse AST and extract dict
-            tree = ast.parse(content)
+            manifest_data = self._literal_manifest(content)
+            if manifest_data is None:
+                # Parse AST and extract dict
+                tree = ast.parse(content)
 
-            # Find dictionary assignment
-            manifest_data = {}
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Dict):
-                    manifest_data = self._extract_dict(node)
-                    break
+                # Find dictionary assignment
+                manifest_data = {}
+                for node in ast.walk(tree):
+                    if isinstance(node, ast.Dict):
+                        manifest_data = self._extract_dict(node)
+                        break
 
             # Cache result
-            self._cache[cache_key] = manifest_data
+            with self._lock:
+                self._cache[module_path] = manifest_data
+                if self._cache_path and self._json_safe(manifest_data):
+                    self._disk_cache[disk_key] = [stamp, manifest_data]
+                    self._disk_dirty = True
             return manifest_data
 
         except Exception as e:
             print(f"Error parsing manifest {manifest_path}: {e}")
             return {}
 
+    @staticmethod
+    def _json_safe(data: Dict) -> bool:
+        """
+        Check that manifest data survives a JSON round trip unchanged.
+
+        Args:
+            data: Manifest dict
+
+        Returns:
+            False for values JSON would alter or reject (tuples, sets,
+            bytes, non-string keys); such manifests are not persisted
+        """
+        try:
+            return json.loads(json.dumps(data)) == data
+        except (TypeError, ValueError):
+            return False
+
+    @staticmethod
+    def _literal_manifest(content: str) -> Optional[Dict]:
+        """
+        Evaluate a manifest that is a plain dict literal.
+
+        Args:
+            content: Manifest source code
+
+        Returns:
+            Manifest dict, or None if the file is not a single literal dict
+            (e.g. has a module docstring or non-literal values)
+        """
+        try:
+            data = ast.literal_eval(content)
+        except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+            return None
+        return data if isinstance(data, dict) else None
+
     def _extract_dict(self, node: ast.Dict) -> Dict:
         """
         Extract dictionary from AST node.
@@ -101,8 +254,6 @@ class ManifestParser:
             # Get key name
             if isinstance(key, ast.Constant):
                 key_name = key.value
-            elif isinstance(key, ast.Str):  # Python < 3.8
-                key_name = key.s
             else:
                 continue
 
@@ -123,16 +274,10 @@ class ManifestParser:
         """
         if isinstance(node, ast.Constant):
             return node.value
-        elif isinstance(node, ast.Str):  # Python < 3.8
-            return node.s
-        elif isinstance(node, ast.Num):  # Python < 3.8
-            return node.n
         elif isinstance(node, ast.List):
             return [self._extract_value(item) for item in node.elts]
         elif isinstance(node, ast.Dict):
             return self._extract_dict(node)
-        elif isinstance(node, ast.NameConstant):  # Python < 3.8
-            return node.value
         else:
             return None
 
@@ -146,45 +291,55 @@ class ManifestParser:
         Returns:
             List of dependency module names
         """
-        module_path = self.find_module_path(module_name)
-        if not module_path:
-            return []
+        if self._module_index is None:
+            self._build_index()
+        return self._deps.get(module_name, [])
 
-        manifest = self.parse_manifest(module_path)
-        depends = manifest.get('depends', [])
-
-        # Filter out None values and ensure strings
-        return [dep for dep in depends if dep]
-
-    def get_all_dependencies_recursive(self, module_name: str, visited: Optional[set] = None) -> List[str]:
+    def get_all_dependencies_recursive(self, module_name: str) -> List[str]:
         """
         Get all dependencies recursively.
 
+        Walks the dependency tree depth-first with an explicit stack (circular
+        dependencies are visited once). Results are memoized per module.
+
         Args:
             module_name: Name of the module
-            visited: Set of already visited modules (for circular dependency detection)
 
         Returns:
             List of all dependency module names (including transitive)
         """
-        if visited is None:
-            visited = set()
-
-        if module_name in visited:
-            return []
-
-        visited.add(module_name)
+        cached = self._trans_deps.get(module_name)
+        if cached is not None:
+            return list(cached)
 
+        visited = {module_name}
+        # Frames: [module deps, next dep index, ordered accumulator]
         direct_deps = self.get_dependencies(module_name)
-        all_deps = list(direct_deps)
+        stack = [[direct_deps, 0, dict.fromkeys(direct_deps)]]
+
+        while True:
+            frame = stack[-1]
+            deps = frame[0]
+            if frame[1] < len(deps):
+                dep = deps[frame[1]]
+                frame[1] += 1
+                if dep not in visited:
+                    visited.add(dep)
+                    dep_deps = self.get_dependencies(dep)
+                    stack.append([dep_deps, 0, dict.fromkeys(dep_deps)])
+                continue
 
-        for dep in direct_deps:
-            transitive_deps = self.get_all_dependencies_recursive(dep, visited)
-            for td in transitive_deps:
-                if td not in all_deps:
-                    all_deps.append(td)
+            stack.pop()
+            if not stack:
+                break
+            parent_acc = stack[-1][2]
+            for td in frame[2]:
+                parent_acc.setdefault(td)
 
-        return all_deps
+        result = tuple(frame[2])
+        with self._lock:
+            self._trans_deps[module_name] = result
+        return list(result)
 
     def get_module_info(self, module_name: str) -> Dict:
         """
@@ -200,7 +355,7 @@ class ManifestParser:
         if not module_path:
             return {}
 
-        manifest = self.parse_manifest(module_path)
+        manifest = self._manifests[module_name]
 
         return {
             'name': manifest.get('name', module_name),
@@ -208,3 +363,17 @@ class ManifestParser:
             'depends': manifest.get('depends', []),
             'path': str(module_path)
         }
+
+
+# Parsers with a persistent cache, flushed by one exit hook. Weak
+# references: registering does not keep parsers (and their manifests) alive.
+_LIVE_PARSERS: 'weakref.WeakSet[ManifestParser]' = weakref.WeakSet()
+
+
+def _save_all_caches():
+    """Save the persistent caches of all live parsers at exit."""
+    for parser in list(_LIVE_PARSERS):
+        parser.save_cache()
+
+
+atexit.register(_save_all_caches)
@@ -4,24 +4,192 @@ Extracts model definitions, inheritance, and fields using AST.
 """
 
 import ast
+import json
+import multiprocessing
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing.util import Finalize
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, cast
+
+from .ast_cache import PersistentASTCache
+
+try:
+    import orjson  # Optional: faster serialization
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# ast.Constant-only parsing (ast.Str/ast.Num/ast.NameConstant are gone)
+if sys.version_info < (3, 8):
+    raise RuntimeError("Odoo Model Inspector requires Python 3.8+")
+
+# Bump when parse output (ModelInfo contents) changes: invalidates the AST cache
+PARSER_SCHEMA_VERSION = 4
+
+
+def _read_source(path: str) -> Tuple[bytes, os.stat_result]:
+    """
+    Read a whole file with one fstat-sized read (no buffered/text IO layers).
+
+    Args:
+        path: File path
+
+    Returns:
+        Tuple of (file content, stat result of the open file)
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        st = os.fstat(fd)
+        # One extra byte tells whether the file grew since fstat
+        data = os.read(fd, st.st_size + 1)
+        if len(data) > st.st_size:
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b''.join(chunks)
+    finally:
+        os.close(fd)
+    return data, st
+
+
+def _iter_py_files(root: str) -> Iterator[Path]:
+    """
+    Yield model source files below a directory.
+
+    Hidden and __pycache__ directories are pruned without descending, as
+    are __init__.py and other dunder files. Like Path.rglob, files of a
+    directory come before its subdirectories and directory symlinks are
+    not followed.
+
+    Args:
+        root: Directory path
+
+    Yields:
+        Paths of .py files
+    """
+    subdirs = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(('.', '__')):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif name.endswith('.py'):
+                    yield Path(entry.path)
+    except OSError:
+        return  # unreadable directory
+
+    for subdir in subdirs:
+        yield from _iter_py_files(subdir)
+
+
+def _stat_files(py_files: List[Path]) -> List[Optional[os.stat_result]]:
+    """
+    Stat files once for cache validation and parsing.
+
+    Args:
+        py_files: File paths
+
+    Returns:
+        Stat result per file (None for files that cannot be stat'ed)
+    """
+    stats: List[Optional[os.stat_result]] = []
+    for py_file in py_files:
+        try:
+            stats.append(os.stat(py_file))
+        except OSError:
+            stats.append(None)
+    return stats
+
+
+def _file_stamps(py_files: List[Path], stats: List[Optional[os.stat_result]]) -> Tuple[Tuple[str, int, int], ...]:
+    """
+    Build the validation key of a module cache entry.
+
+    Args:
+        py_files: File paths
+        stats: Stat results from _stat_files
+
+    Returns:
+        (path, mtime_ns, size) per file; -1 for files that cannot be stat'ed
+    """
+    return tuple(
+        (str(py_file), st.st_mtime_ns, st.st_size) if st is not None else (str(py_file), -1, -1)
+        for py_file, st in zip(py_files, stats)
+    )
+
+
+class _SuperCallFound(Exception):
+    """Raised by _SuperCallFinder to stop traversal at the first super() call."""
+
+
+class _SuperCallFinder(ast.NodeVisitor):
+    """Finds super() calls in a method body, aborting on the first one."""
+
+    def visit_Call(self, node: ast.Call) -> None:
+        if isinstance(node.func, ast.Name) and node.func.id == 'super':
+            raise _SuperCallFound
+        self.generic_visit(node)
+
+    # super() in nested functions/classes belongs to a different method
+    def visit_FunctionDef(self, node: ast.AST) -> None:
+        pass
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+    visit_ClassDef = visit_FunctionDef
+    visit_Lambda = visit_FunctionDef
+
+
+# Stateless, so one instance is shared (also across threads)
+_SUPER_CALL_FINDER = _SuperCallFinder()
 
 
 class ModelInfo:
     """Information about a model definition."""
 
-    def __init__(self, module: str, file_path: Path, line: int):
+    # No per-instance __dict__: one instance per model class in every parsed file
+    __slots__ = (
+        'module', 'file_path', 'line', 'model_name', 'inherits',
+        'is_base', 'fields', 'methods'
+    )
+
+    def __init__(
+        self,
+        module: str,
+        file_path: Path,
+        line: int,
+        model_name: Optional[str] = None,
+        inherits: Optional[List[str]] = None,
+        is_base: bool = False,
+        fields: Optional[Dict[str, Dict[str, Any]]] = None,
+        methods: Optional[Dict[str, bool]] = None
+    ) -> None:
         self.module = module
         self.file_path = file_path
         self.line = line
-        self.model_name: Optional[str] = None
-        self.inherits: List[str] = []
-        self.is_base = False
-        self.fields: Dict[str, Dict[str, any]] = {}  # field_name -> {type, required}
-        self.methods: Dict[str, bool] = {}  # method_name -> has_super
-
-    def to_dict(self) -> Dict:
+        self.model_name = model_name
+        self.inherits: List[str] = inherits if inherits is not None else []
+        self.is_base = is_base
+        self.fields: Dict[str, Dict[str, Any]] = fields if fields is not None else {}  # field_name -> {type, required}
+        self.methods: Dict[str, bool] = methods if methods is not None else {}  # method_name -> has_super
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Any, ...]]:
+        # Explicit constructor args: also picklable when compiled with mypyc
+        return (ModelInfo, (
+            self.module, self.file_path, self.line, self.model_name,
+            self.inherits, self.is_base, self.fields, self.methods
+        ))
+
+    def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             'module': self.module,
@@ -36,20 +204,80 @@ class ModelInfo:
             'methods_count': len(self.methods)
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact UTF-8 JSON (same content as to_dict())."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def to_json_bytes_all(models: Iterable[ModelInfo]) -> bytes:
+    """
+    Serialize ModelInfo objects to one compact UTF-8 JSON array.
+
+    With orjson, each model is converted by to_dict() while encoding, so
+    no intermediate list of dicts is built.
+
+    Args:
+        models: ModelInfo objects
+
+    Returns:
+        JSON array of to_dict() results
+    """
+    if orjson is not None:
+        return orjson.dumps(models if isinstance(models, list) else list(models), default=ModelInfo.to_dict)
+    return json.dumps(
+        [m.to_dict() for m in models], ensure_ascii=False, separators=(',', ':')
+    ).encode('utf-8')
+
 
 class ModelParser:
     """Parses Python files to extract Odoo model definitions."""
 
-    # Known Odoo field types
-    FIELD_TYPES = {
+    # Known Odoo field types (matched exactly against the called name;
+    # a frozenset lookup is several times faster than an anchored regex)
+    FIELD_TYPES: ClassVar[FrozenSet[str]] = frozenset({
         'Char', 'Text', 'Html', 'Integer', 'Float', 'Monetary',
         'Boolean', 'Date', 'Datetime', 'Binary', 'Selection',
         'Many2one', 'One2many', 'Many2many', 'Reference',
-        'Json', 'Properties'
-    }
+        'Many2oneReference', 'Json', 'Properties'
+    })
+
+    # Model base classes, matched as models.<name> on the class bases
+    MODEL_BASES: ClassVar[FrozenSet[str]] = frozenset({'Model', 'TransientModel', 'AbstractModel'})
+
+    # Smaller batches are parsed in-process (pool round-trips cost more)
+    MIN_FILES_FOR_PROCESSES: ClassVar[int] = 4
+
+    # Parsed files kept in memory (least recently used are evicted first)
+    MEMORY_CACHE_SIZE: ClassVar[int] = 4096
 
-    def __init__(self):
-        self._cache: Dict[str, List[ModelInfo]] = {}
+    def __init__(self, cache_dir: Optional[Path] = None, processes: int = 0, parse_methods: bool = True) -> None:
+        """
+        Initialize parser.
+
+        Args:
+            cache_dir: Optional directory for the persistent AST cache
+                (disabled when None)
+            processes: Parse model files in this many worker processes
+                (0 or 1 parses in-process)
+            parse_methods: Collect methods and their super() calls; callers
+                that only need fields and inheritance pass False to skip
+                walking method bodies
+        """
+        self._cache_dir = cache_dir
+        self._parse_methods = parse_methods
+        # Field-only results must not be served to parsers that want methods
+        variant = '' if parse_methods else '-nomethods'
+        self._ast_cache = PersistentASTCache(cache_dir, PARSER_SCHEMA_VERSION, variant) if cache_dir else None
+        self._processes = processes
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        # file path -> (mtime_ns, size, models), in LRU order
+        self._cache: 'OrderedDict[str, Tuple[int, int, List[ModelInfo]]]' = OrderedDict()
+        # (module_path, model_name) -> (file stamps, models found in the module), in LRU order
+        self._module_cache: 'OrderedDict[Tuple[str, Optional[str]], Tuple[Tuple[Tuple[str, int, int], ...], List[ModelInfo]]]' = OrderedDict()
+        # Guards cache access (files may be parsed from worker threads)
+        self._lock = threading.Lock()
 
     def parse_file(self, file_path: Path, module_name: str) -> List[ModelInfo]:
         """
@@ -62,31 +290,149 @@ class ModelParser:
         Returns:
             List of ModelInfo objects
         """
-        cache_key = str(file_path)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
-        models = []
+        # Never skipped without a needle
+        return cast(List[ModelInfo], self._parse_file(file_path, module_name))
+
+    def _parse_file(
+        self,
+        file_path: Path,
+        module_name: str,
+        needle: Optional[bytes] = None,
+        st: Optional[os.stat_result] = None
+    ) -> Optional[List[ModelInfo]]:
+        """
+        Parse Python file, optionally skipping sources that lack a byte string.
 
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+        Args:
+            file_path: Path to Python file
+            module_name: Name of the module
+            needle: If given, files whose source does not contain it are
+                skipped (nothing is parsed or cached for them)
+            st: Stat result of the file if the caller already has one
+                (taken before reading; stat'ed here when None)
 
-            tree = ast.parse(content)
+        Returns:
+            List of ModelInfo objects, or None if skipped
+        """
+        cache_key = str(file_path)
+        models: List[ModelInfo] = []
+        digest: Optional[str] = None
 
-            # Find class definitions
-            for node in ast.walk(tree):
+        try:
+            # Stat before reading: a later change is caught by the next lookup
+            if st is None:
+                st = os.stat(cache_key)
+            cached = self._cache_get(cache_key, st)
+            if cached is not None:
+                return cached
+
+            # Unchanged file (same mtime and size): load without reading it
+            if self._ast_cache:
+                digest = self._ast_cache.lookup_stat(cache_key, st)
+                if digest:
+                    cached = self._load_cached(digest, file_path, module_name)
+                    if cached is not None:
+                        self._cache_put(cache_key, st, cached)
+                        return cached
+
+            source, st = _read_source(cache_key)
+
+            # A file that never mentions the model cannot define or extend it
+            if needle is not None and needle not in source:
+                return None
+
+            # Check persistent cache (keyed by content, so valid for any path)
+            if self._ast_cache:
+                digest = self._ast_cache.key(source)
+                self._ast_cache.record_stat(cache_key, st, digest)
+                cached = self._load_cached(digest, file_path, module_name)
+                if cached is not None:
+                    self._cache_put(cache_key, st, cached)
+                    return cached
+
+            # Compile raw bytes (honours coding cookies/BOM, no str decode step)
+            tree = cast(ast.Module, compile(source, cache_key, 'exec', ast.PyCF_ONLY_AST, dont_inherit=True))
+
+            # Find class definitions (Odoo models are module-level classes)
+            for node in tree.body:
                 if isinstance(node, ast.ClassDef):
                     model_info = self._parse_class(node, module_name, file_path)
                     if model_info:
                         models.append(model_info)
 
+        except SyntaxError as e:
+            print(f"Syntax error in {file_path}:{e.lineno}: {e.msg}")
+            # Failures are not persisted so the error is reported on every run
+            digest = None
+
         except Exception as e:
             print(f"Error parsing {file_path}: {e}")
+            digest = None
 
-        self._cache[cache_key] = models
+        if digest and self._ast_cache:
+            self._ast_cache.put(digest, models)
+
+        if st is not None:
+            self._cache_put(cache_key, st, models)
         return models
 
+    def _cache_get(self, path: str, st: os.stat_result) -> Optional[List[ModelInfo]]:
+        """
+        Look up a file in the in-memory cache.
+
+        Args:
+            path: File path
+            st: Current stat result of the file
+
+        Returns:
+            List of ModelInfo objects, or None if missing or the file changed
+        """
+        with self._lock:
+            entry = self._cache.get(path)
+            if entry is None or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+                return None
+            self._cache.move_to_end(path)
+        return entry[2]
+
+    def _cache_put(self, path: str, st: os.stat_result, models: List[ModelInfo]) -> None:
+        """
+        Store a parse result in the in-memory cache, evicting the oldest entries.
+
+        Args:
+            path: File path
+            st: Stat result taken before the file was read
+            models: List of ModelInfo objects
+        """
+        with self._lock:
+            self._cache[path] = (st.st_mtime_ns, st.st_size, models)
+            self._cache.move_to_end(path)
+            while len(self._cache) > self.MEMORY_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def _load_cached(self, digest: str, file_path: Path, module_name: str) -> Optional[List[ModelInfo]]:
+        """
+        Load models from the persistent cache and bind them to this file.
+
+        Args:
+            digest: Cache key of the file content
+            file_path: Path to Python file
+            module_name: Name of the module
+
+        Returns:
+            List of ModelInfo objects or None on miss
+        """
+        if self._ast_cache is None:
+            return None
+        cached = self._ast_cache.get(digest)
+        if cached is None:
+            return None
+
+        # Same source may live in several modules: rebind location
+        for model_info in cached:
+            model_info.module = module_name
+            model_info.file_path = file_path
+        return cached
+
     def _parse_class(self, class_node: ast.ClassDef, module_name: str, file_path: Path) -> Optional[ModelInfo]:
         """
         Parse class definition to extract model info.
@@ -99,29 +445,31 @@ class ModelParser:
         Returns:
             ModelInfo object or None
         """
-        model_info = ModelInfo(
-            module=module_name,
-            file_path=file_path,
-            line=class_node.lineno
-        )
-
-        # Check if inherits from models.Model or models.TransientModel
+        # Check if inherits from models.Model, TransientModel or AbstractModel
+        # (name-only test: most classes are rejected here)
         is_model_class = False
         for base in class_node.bases:
-            base_name = self._get_attribute_name(base)
-            if base_name in ['models.Model', 'models.TransientModel', 'models.AbstractModel']:
+            if (isinstance(base, ast.Attribute) and base.attr in self.MODEL_BASES
+                    and isinstance(base.value, ast.Name) and base.value.id == 'models'):
                 is_model_class = True
                 break
 
         if not is_model_class:
             return None
 
+        model_info = ModelInfo(
+            module=module_name,
+            file_path=file_path,
+            line=class_node.lineno
+        )
+
         # Parse class body
         for node in class_node.body:
             if isinstance(node, ast.Assign):
                 self._parse_assignment(node, model_info)
             elif isinstance(node, ast.FunctionDef):
-                self._parse_method(node, model_info)
+                if self._parse_methods:
+                    self._parse_method(node, model_info)
 
         # Only return if we found _name or _inherit
         if model_info.model_name or model_info.inherits:
@@ -129,7 +477,7 @@ class ModelParser:
 
         return None
 
-    def _parse_assignment(self, assign_node: ast.Assign, model_info: ModelInfo):
+    def _parse_assignment(self, assign_node: ast.Assign, model_info: ModelInfo) -> None:
         """
         Parse assignment statement.
 
@@ -156,12 +504,12 @@ class ModelParser:
                     model_info.model_name = inherits[0]
 
             # Check for fields
-            elif self._is_field_assignment(assign_node.value):
-                field_info = self._extract_field_info(assign_node.value)
+            else:
+                field_info = self._parse_field_call(assign_node.value)
                 if field_info:
                     model_info.fields[var_name] = field_info
 
-    def _parse_method(self, func_node: ast.FunctionDef, model_info: ModelInfo):
+    def _parse_method(self, func_node: ast.FunctionDef, model_info: ModelInfo) -> None:
         """
         Parse method definition.
 
@@ -190,87 +538,62 @@ class ModelParser:
         Returns:
             True if contains super() call
         """
-        for node in ast.walk(func_node):
-            if isinstance(node, ast.Call):
-                func_name = self._get_attribute_name(node.func)
-                if func_name == 'super':
-                    return True
+        try:
+            for stmt in func_node.body:
+                _SUPER_CALL_FINDER.visit(stmt)
+        except _SuperCallFound:
+            return True
         return False
 
-    def _is_field_assignment(self, value_node) -> bool:
+    @staticmethod
+    def _final_attr(node: ast.expr) -> Optional[str]:
         """
-        Check if assignment is a field definition.
+        Get the last name of a call target (fields.Char -> 'Char', Char -> 'Char').
 
         Args:
-            value_node: AST value node
+            node: AST node (Name or Attribute)
 
         Returns:
-            True if it's a field assignment
+            Final name or None
         """
-        if isinstance(value_node, ast.Call):
-            func_name = self._get_attribute_name(value_node.func)
-            # Check for fields.* or direct field type
-            if func_name and ('fields.' in func_name or any(ft in func_name for ft in self.FIELD_TYPES)):
-                return True
-        return False
+        if isinstance(node, ast.Attribute):
+            return node.attr
+        if isinstance(node, ast.Name):
+            return node.id
+        return None
 
-    def _extract_field_info(self, value_node) -> Optional[Dict[str, any]]:
+    def _parse_field_call(self, value_node: ast.expr) -> Optional[Dict[str, Any]]:
         """
-        Extract field information from assignment.
+        Extract field information from an assigned value.
 
         Args:
             value_node: AST value node
 
         Returns:
-            Dict with 'type' and 'required' or None
+            Dict with 'type' and 'required', or None if not a field definition
         """
         if not isinstance(value_node, ast.Call):
             return None
 
-        func_name = self._get_attribute_name(value_node.func)
-        if not func_name:
-            return None
-
-        # Extract type from fields.Char -> Char
-        field_type = None
-        for ft in self.FIELD_TYPES:
-            if ft in func_name:
-                field_type = ft
-                break
-
-        if not field_type:
+        field_type = self._final_attr(value_node.func)
+        if field_type not in self.FIELD_TYPES:
             return None
 
         # Extract required parameter
-        required = self._extract_required_param(value_node)
-
-        return {
-            'type': field_type,
-            'required': required
-        }
-
-    def _extract_required_param(self, call_node: ast.Call) -> bool:
-        """
-        Extract 'required' parameter from field call.
-
-        Args:
-            call_node: AST Call node
-
-        Returns:
-            True if required=True, False otherwise
-        """
-        # Check keyword arguments
-        for keyword in call_node.keywords:
+        required = False
+        for keyword in value_node.keywords:
             if keyword.arg == 'required':
-                # Get the value
                 if isinstance(keyword.value, ast.Constant):
-                    return bool(keyword.value.value)
-                elif isinstance(keyword.value, ast.NameConstant):  # Python < 3.8
-                    return bool(keyword.value.value)
+                    required = bool(keyword.value.value)
+                break
 
-        return False
+        field_info = _FIELD_SENTINELS.get((field_type, required))
+        if field_info is None:
+            # FIELD_TYPES extended after import (e.g. by a subclass)
+            field_info = {'type': field_type, 'required': required}
+        return field_info
 
-    def _extract_string_value(self, node) -> Optional[str]:
+    def _extract_string_value(self, node: ast.expr) -> Optional[str]:
         """
         Extract string value from AST node.
 
@@ -280,13 +603,9 @@ class ModelParser:
         Returns:
             String value or None
         """
-        if isinstance(node, ast.Constant):
-            return node.value if isinstance(node.value, str) else None
-        elif isinstance(node, ast.Str):  # Python < 3.8
-            return node.s
-        return None
+        return node.value if isinstance(node, ast.Constant) and isinstance(node.value, str) else None
 
-    def _extract_inherit_value(self, node) -> List[str]:
+    def _extract_inherit_value(self, node: ast.expr) -> List[str]:
         """
         Extract _inherit value (can be string or list of strings).
 
@@ -297,13 +616,13 @@ class ModelParser:
             List of inherited model names
         """
         # Single string
-        if isinstance(node, (ast.Constant, ast.Str)):
+        if isinstance(node, ast.Constant):
             value = self._extract_string_value(node)
             return [value] if value else []
 
         # List of strings
         if isinstance(node, ast.List):
-            result = []
+            result: List[str] = []
             for item in node.elts:
                 value = self._extract_string_value(item)
                 if value:
@@ -312,25 +631,6 @@ class ModelParser:
 
         return []
 
-    def _get_attribute_name(self, node) -> Optional[str]:
-        """
-        Get full attribute name from AST node.
-
-        Args:
-            node: AST node (Name or Attribute)
-
-        Returns:
-            Full attribute name (e.g., 'fields.Char')
-        """
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            value_name = self._get_attribute_name(node.value)
-            if value_name:
-                return f"{value_name}.{node.attr}"
-            return node.attr
-        return None
-
     def find_models_in_module(self, module_path: Path, module_name: str, model_name: Optional[str] = None) -> List[ModelInfo]:
         """
         Find all models in a module.
@@ -343,23 +643,186 @@ class ModelParser:
         Returns:
             List of ModelInfo objects
         """
-        models = []
-        models_dir = module_path / 'models'
-
-        if not models_dir.exists():
-            return models
-
-        # Parse all Python files in models directory
-        for py_file in models_dir.rglob('*.py'):
-            if py_file.name.startswith('__'):
+        # Parse all Python files in models directory (none if it is missing)
+        py_files = list(_iter_py_files(str(module_path / 'models')))
+
+        # Cached result is valid only for the same files with the same
+        # mtime and size (listed and stat'ed before parsing; the stats are
+        # reused by the parse, so each file is stat'ed once)
+        stats = _stat_files(py_files)
+        stamps = _file_stamps(py_files, stats)
+        cache_key = (str(module_path), model_name)
+        with self._lock:
+            entry = self._module_cache.get(cache_key)
+            if entry is not None and entry[0] == stamps:
+                self._module_cache.move_to_end(cache_key)
+                return list(entry[1])
+
+        models: List[ModelInfo] = []
+        # Prefilter: skip parsing files whose bytes don't contain the model name
+        needle = model_name.encode('utf-8') if model_name else None
+
+        for file_models in self._parse_files(py_files, module_name, needle, stats):
+            if file_models is None:
                 continue
 
-            file_models = self.parse_file(py_file, module_name)
-
             # Filter by model_name if specified
             if model_name:
                 file_models = [m for m in file_models if m.model_name == model_name or model_name in m.inherits]
 
             models.extend(file_models)
 
-        return models
+        with self._lock:
+            self._module_cache[cache_key] = (stamps, models)
+            self._module_cache.move_to_end(cache_key)
+            while len(self._module_cache) > self.MEMORY_CACHE_SIZE:
+                self._module_cache.popitem(last=False)
+        return list(models)
+
+    def _parse_files(
+        self,
+        py_files: List[Path],
+        module_name: str,
+        needle: Optional[bytes] = None,
+        stats: Optional[List[Optional[os.stat_result]]] = None
+    ) -> List[Optional[List[ModelInfo]]]:
+        """
+        Parse several files, in worker processes when enabled.
+
+        Args:
+            py_files: Paths to Python files
+            module_name: Name of the module
+            needle: Optional byte string prefilter (see _parse_file)
+            stats: Optional stat results from _stat_files, one per file
+
+        Returns:
+            List of ModelInfo lists (None for skipped files), one per file
+        """
+        if stats is None:
+            stats = _stat_files(py_files)
+
+        if self._processes <= 1:
+            return [self._parse_file(f, module_name, needle, st) for f, st in zip(py_files, stats)]
+
+        results: Dict[str, Optional[List[ModelInfo]]] = {}
+        pending: List[Path] = []
+        pending_stats: List[Optional[os.stat_result]] = []
+        for py_file, st in zip(py_files, stats):
+            cache_key = str(py_file)
+            # Files that cannot be stat'ed are reported by the worker
+            cached = self._cache_get(cache_key, st) if st is not None else None
+            if cached is not None:
+                results[cache_key] = cached
+            else:
+                pending.append(py_file)
+                pending_stats.append(st)
+
+        if len(pending) < self.MIN_FILES_FOR_PROCESSES:
+            return [self._parse_file(f, module_name, needle, st) for f, st in zip(py_files, stats)]
+
+        pool = self._get_process_pool()
+        parsed = pool.map(
+            _parse_file_worker, pending, repeat(module_name), repeat(self._cache_dir), repeat(needle),
+            repeat(self._parse_methods)
+        )
+        for py_file, st, file_models in zip(pending, pending_stats, parsed):
+            results[str(py_file)] = file_models
+            # Stat was taken before dispatch, so a later change is still noticed
+            if file_models is not None and st is not None:
+                self._cache_put(str(py_file), st, file_models)
+
+        return [results[str(f)] for f in py_files]
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Create the shared worker pool on first use."""
+        with self._lock:
+            if self._process_pool is None:
+                # Spawn, not fork: the pool is started from scanner threads, and
+                # forking while other threads hold locks (stdout, caches) can
+                # deadlock the children
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self._processes, mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._process_pool
+
+    def clear_cache(self) -> None:
+        """Drop in-memory parse and module results (the persistent cache is kept)."""
+        with self._lock:
+            self._cache.clear()
+            self._module_cache.clear()
+
+    def close(self) -> None:
+        """Shut down worker processes (if any were started)."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+
+
+# One shared {type, required} dict per combination. Field info dicts are
+# read-only downstream (only serialized), so models share them instead of
+# allocating one per field; do not mutate them.
+_FIELD_SENTINELS: Dict[Tuple[str, bool], Dict[str, Any]] = {
+    (ft, required): {'type': sys.intern(ft), 'required': required}
+    for ft in ModelParser.FIELD_TYPES
+    for required in (False, True)
+}
+
+
+# Shared parser returned by get_default_parser (created on first use)
+_default_parser: Optional[ModelParser] = None
+_default_parser_lock = threading.Lock()
+
+
+def get_default_parser() -> ModelParser:
+    """
+    Get the process-wide parser (in-process parsing, no persistent cache).
+
+    Callers that inspect many modules should share one parser so files
+    reached through several _inherit chains are parsed once. Cached
+    results are revalidated against file stats, so edits are picked up.
+
+    Returns:
+        Shared ModelParser instance
+    """
+    global _default_parser
+    if _default_parser is None:
+        with _default_parser_lock:
+            if _default_parser is None:
+                _default_parser = ModelParser()
+    return _default_parser
+
+
+# Per-process parser used by _parse_file_worker
+_worker_parser: Optional[ModelParser] = None
+
+
+def _parse_file_worker(
+    file_path: Path,
+    module_name: str,
+    cache_dir: Optional[Path],
+    needle: Optional[bytes] = None,
+    parse_methods: bool = True
+) -> Optional[List[ModelInfo]]:
+    """
+    Parse a file in a worker process.
+
+    The parser (and its in-memory cache) is created once per process and
+    shares the persistent AST cache with the parent.
+
+    Args:
+        file_path: Path to Python file
+        module_name: Name of the module
+        cache_dir: Directory of the persistent AST cache or None
+        needle: Optional byte string prefilter (see ModelParser._parse_file)
+        parse_methods: Collect methods (see ModelParser)
+
+    Returns:
+        List of ModelInfo objects, or None if skipped
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = ModelParser(cache_dir=cache_dir, parse_methods=parse_methods)
+        if _worker_parser._ast_cache:
+            # Pool workers exit without running atexit handlers
+            Finalize(None, _worker_parser._ast_cache.save_index, exitpriority=0)
+    return _worker_parser._parse_file(file_path, module_name, needle)